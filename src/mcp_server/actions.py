@@ -2,15 +2,82 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import NoReturn
+import random
+import time
+from collections import OrderedDict
+from types import TracebackType
+from typing import Any, NoReturn
 
+import anyio
 import httpx
+import orjson
 import structlog
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 logger = structlog.get_logger(__name__)
 
+_MAX_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Failures raised before the request reached GitHub, so even a POST can be resent
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_MAX_RATE_LIMIT_WAIT = 60.0
+
+# Backoff waits go through these hooks so tests can skip them without patching the stdlib
+_sleep = time.sleep
+_async_sleep = anyio.sleep
+
+
+def _request_kwargs(payload: dict | None) -> dict[str, Any]:
+    """httpx kwargs carrying ``payload`` as an orjson-encoded JSON body."""
+    if payload is None:
+        return {}
+    return {"content": orjson.dumps(payload), "headers": {"Content-Type": "application/json"}}
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with up to 2s of jitter so concurrent retries spread out."""
+    return min(10.0, 2.0**attempt + random.uniform(0, 2))
+
+
+def _budget_delay(remaining: int, reset: int) -> float | None:
+    """Seconds to wait before spending more of an exhausted rate-limit budget.
+
+    None when the budget resets beyond ``_MAX_RATE_LIMIT_WAIT``: no wait we are
+    willing to make would let the request through.
+    """
+    if remaining > 1 or not reset:
+        return 0.0
+    delay = max(0.0, reset - time.time())
+    return delay if delay <= _MAX_RATE_LIMIT_WAIT else None
+
+
+def _budget_wait(remaining: int, reset: int) -> float:
+    """``_budget_delay`` for a request about to be sent; fails fast instead of returning None."""
+    delay = _budget_delay(remaining, reset)
+    if delay is None:
+        raise ValueError(f"GitHub API rate limit exceeded: resets in {int(reset - time.time())}s")
+    return delay
+
+
+def _retry_delay(response: httpx.Response, attempt: int, idempotent: bool = True) -> float | None:
+    """Backoff before retrying ``response``, or None when it should not be retried.
+
+    A 5xx may arrive after GitHub applied the write, so non-idempotent requests are
+    only retried when they were rejected outright (429 or an exhausted budget). Nothing
+    is retried when GitHub asks for a longer wait than ``_MAX_RATE_LIMIT_WAIT``.
+    """
+    headers = response.headers
+    status = response.status_code
+    exhausted = status == 403 and headers.get("X-RateLimit-Remaining") == "0"
+    if not exhausted and (status not in _RETRY_STATUSES or (status >= 500 and not idempotent)):
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        delay = float(retry_after)
+        return delay if delay <= _MAX_RATE_LIMIT_WAIT else None
+    if exhausted:
+        return _budget_delay(0, int(headers.get("X-RateLimit-Reset", 0)))
+    return _backoff(attempt)
+
 
 def _handle_http_error(e: httpx.HTTPStatusError) -> NoReturn:
     """Extract GitHub error message and raise appropriate ValueError."""
@@ -29,117 +96,278 @@ def _handle_http_error(e: httpx.HTTPStatusError) -> NoReturn:
     raise ValueError(f"GitHub API error ({e.response.status_code}): {gh_message}") from e
 
 
-@dataclass(slots=True)
-class GitHubClient:
-    token: str
-    base_url: str = "https://api.github.com"
-    _client: httpx.Client = field(init=False, repr=False)
-    rate_limit_remaining: int = field(default=5000, init=False)
-    rate_limit_reset: int = field(default=0, init=False)
+class _GitHubClientBase:
+    """Rate-limit, ETag cache and response handling shared by the sync and async clients.
+
+    Subclasses own the transport: they send the request prepared by ``_prepare`` and hand
+    the result to ``_finish``, or any ``httpx.HTTPError`` to ``_fail``.
+    """
+
+    __slots__ = (
+        "token",
+        "base_url",
+        "etag_cache_size",
+        "_etag_cache",
+        "rate_limit_remaining",
+        "rate_limit_reset",
+    )
 
-    def __post_init__(self) -> None:
-        self._client = httpx.Client(timeout=10.0, headers=self._headers())
+    def __init__(self, token: str, base_url: str, etag_cache_size: int) -> None:
+        self.token = token
+        self.base_url = base_url
+        self.etag_cache_size = etag_cache_size
+        self.rate_limit_remaining = 5000
+        self.rate_limit_reset = 0
+        self._etag_cache: OrderedDict[str, tuple[str, httpx.Response]] = OrderedDict()
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Accept": "application/vnd.github+json",
-            "Authorization": f"Bearer {self.token}"
-        }
+    @staticmethod
+    def _headers(token: str) -> dict[str, str]:
+        return {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {token}"}
 
     def _update_rate_limits(self, response: httpx.Response) -> None:
-        if "X-RateLimit-Remaining" in response.headers:
-            self.rate_limit_remaining = int(response.headers["X-RateLimit-Remaining"])
-        if "X-RateLimit-Reset" in response.headers:
-            self.rate_limit_reset = int(response.headers["X-RateLimit-Reset"])
-
-    @retry(
-        wait=wait_exponential(min=1, max=10),
-        stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(httpx.RequestError)
-    )
-    def post(self, path: str, payload: dict | None = None) -> httpx.Response:
-        try:
-            logger.info("github_api_request", method="POST", path=path)
-            response = self._client.post(f"{self.base_url}{path}", json=payload)
-            self._update_rate_limits(response)
-            response.raise_for_status()
-            logger.info("github_api_success", method="POST", path=path, status=response.status_code)
-            return response
-        except httpx.HTTPStatusError as e:
-            logger.error("github_api_error", method="POST", path=path, status=e.response.status_code)
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            self.rate_limit_reset = int(reset)
+
+    def _store_etag(self, path: str, response: httpx.Response) -> None:
+        etag = response.headers.get("ETag")
+        if not etag:
+            return
+        self._etag_cache[path] = (etag, response)
+        self._etag_cache.move_to_end(path)
+        while len(self._etag_cache) > self.etag_cache_size:
+            self._etag_cache.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Drop the cached conditional-GET entry for ``path``."""
+        self._etag_cache.pop(path, None)
+
+    def _prepare(
+        self, method: str, path: str, payload: dict | None
+    ) -> tuple[dict[str, Any], tuple[str, httpx.Response] | None]:
+        """Request kwargs plus the cached entry a GET is revalidating, if any."""
+        kwargs = _request_kwargs(payload)
+        cached = None
+        if method == "GET":
+            cached = self._etag_cache.get(path)
+            if cached:
+                kwargs["headers"] = {"If-None-Match": cached[0]}
+        else:
+            self.invalidate(path)
+        logger.info("github_api_request", method=method, path=path)
+        return kwargs, cached
+
+    def _finish(
+        self,
+        method: str,
+        path: str,
+        response: httpx.Response,
+        cached: tuple[str, httpx.Response] | None,
+    ) -> httpx.Response:
+        if cached and response.status_code == 304:
+            # Conditional hit: GitHub sent no body and did not charge the rate limit
+            self._etag_cache.move_to_end(path)
+            logger.info("github_api_not_modified", method=method, path=path)
+            return cached[1]
+        response.raise_for_status()
+        if method == "GET":
+            self._store_etag(path, response)
+        logger.info(
+            "github_api_success",
+            method=method,
+            path=path,
+            status=response.status_code,
+            rate_limit_remaining=self.rate_limit_remaining,
+        )
+        return response
+
+    @staticmethod
+    def _fail(method: str, path: str, e: httpx.HTTPError) -> NoReturn:
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error("github_api_error", method=method, path=path, status=e.response.status_code)
             _handle_http_error(e)
-        except httpx.RequestError as e:
-            logger.error("github_api_connection_failed", method="POST", path=path, error=str(e))
-            raise ValueError(f"GitHub API connection failed: {e}") from e
-
-    @retry(
-        wait=wait_exponential(min=1, max=10),
-        stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(httpx.RequestError)
-    )
-    def patch(self, path: str, payload: dict | None = None) -> httpx.Response:
+        logger.error("github_api_connection_failed", method=method, path=path, error=str(e))
+        raise ValueError(f"GitHub API connection failed: {e}") from e
+
+
+class GitHubClient(_GitHubClientBase):
+    """Sync GitHub REST client over one pooled ``httpx.Client``."""
+
+    __slots__ = ("_client",)
+
+    def __init__(
+        self, token: str, base_url: str = "https://api.github.com", etag_cache_size: int = 256
+    ) -> None:
+        super().__init__(token, base_url, etag_cache_size)
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            headers=self._headers(token),
+            http2=True,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0),
+        )
+
+    def _await_budget(self) -> None:
+        delay = _budget_wait(self.rate_limit_remaining, self.rate_limit_reset)
+        if delay:
+            logger.warning("github_rate_limit_wait", seconds=delay)
+            _sleep(delay)
+
+    def _request_with_retry(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transport errors, 429/5xx and exhausted budgets.
+
+        POST is not idempotent: it is retried only when GitHub cannot have applied it.
+        """
+        idempotent = method != "POST"
+        self._await_budget()
+        for attempt in range(_MAX_ATTEMPTS - 1):
+            try:
+                response = self._client.request(method, path, **kwargs)
+                self._update_rate_limits(response)
+                delay = _retry_delay(response, attempt, idempotent)
+                if delay is None:
+                    return response
+                logger.warning("github_api_retry", method=method, path=path, status=response.status_code)
+            except httpx.RequestError as e:
+                if not idempotent and not isinstance(e, _CONNECT_ERRORS):
+                    raise
+                logger.warning("github_api_retry", method=method, path=path, error=str(e))
+                delay = _backoff(attempt)
+            _sleep(delay)
+        response = self._client.request(method, path, **kwargs)
+        self._update_rate_limits(response)
+        return response
+
+    def _request(self, method: str, path: str, payload: dict | None = None) -> httpx.Response:
+        kwargs, cached = self._prepare(method, path, payload)
         try:
-            logger.info("github_api_request", method="PATCH", path=path)
-            response = self._client.patch(f"{self.base_url}{path}", json=payload)
-            self._update_rate_limits(response)
-            response.raise_for_status()
-            logger.info("github_api_success", method="PATCH", path=path, status=response.status_code)
-            return response
-        except httpx.HTTPStatusError as e:
-            logger.error("github_api_error", method="PATCH", path=path, status=e.response.status_code)
-            _handle_http_error(e)
-        except httpx.RequestError as e:
-            logger.error("github_api_connection_failed", method="PATCH", path=path, error=str(e))
-            raise ValueError(f"GitHub API connection failed: {e}") from e
-
-    @retry(
-        wait=wait_exponential(min=1, max=10),
-        stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(httpx.RequestError)
-    )
+            response = self._request_with_retry(method, path, **kwargs)
+            return self._finish(method, path, response, cached)
+        except httpx.HTTPError as e:
+            self._fail(method, path, e)
+
     def get(self, path: str) -> httpx.Response:
-        try:
-            logger.info("github_api_request", method="GET", path=path)
-            response = self._client.get(f"{self.base_url}{path}")
-            self._update_rate_limits(response)
-            response.raise_for_status()
-            logger.info(
-                "github_api_success",
-                method="GET",
-                path=path,
-                status=response.status_code,
-                rate_limit_remaining=self.rate_limit_remaining,
-            )
-            return response
-        except httpx.HTTPStatusError as e:
-            logger.error("github_api_error", method="GET", path=path, status=e.response.status_code)
-            _handle_http_error(e)
-        except httpx.RequestError as e:
-            logger.error("github_api_connection_failed", method="GET", path=path, error=str(e))
-            raise ValueError(f"GitHub API connection failed: {e}") from e
-
-    @retry(
-        wait=wait_exponential(min=1, max=10),
-        stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(httpx.RequestError)
-    )
+        return self._request("GET", path)
+
+    def post(self, path: str, payload: dict | None = None) -> httpx.Response:
+        return self._request("POST", path, payload)
+
+    def patch(self, path: str, payload: dict | None = None) -> httpx.Response:
+        return self._request("PATCH", path, payload)
+
     def put(self, path: str, payload: dict | None = None) -> httpx.Response:
-        try:
-            logger.info("github_api_request", method="PUT", path=path)
-            response = self._client.put(f"{self.base_url}{path}", json=payload)
-            self._update_rate_limits(response)
-            response.raise_for_status()
-            logger.info("github_api_success", method="PUT", path=path, status=response.status_code)
-            return response
-        except httpx.HTTPStatusError as e:
-            logger.error("github_api_error", method="PUT", path=path, status=e.response.status_code)
-            _handle_http_error(e)
-        except httpx.RequestError as e:
-            logger.error("github_api_connection_failed", method="PUT", path=path, error=str(e))
-            raise ValueError(f"GitHub API connection failed: {e}") from e
+        return self._request("PUT", path, payload)
 
     def close(self) -> None:
         self._client.close()
 
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncGitHubClient(_GitHubClientBase):
+    """Async GitHub REST client; independent requests can be awaited concurrently.
+
+    Requests share one pooled ``httpx.AsyncClient`` and are gated by a semaphore so
+    concurrent fan-outs stay within ``max_concurrency`` in-flight calls. GETs are
+    revalidated with ETags like ``GitHubClient``.
+    """
+
+    __slots__ = ("max_concurrency", "_client", "_semaphore")
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.github.com",
+        max_concurrency: int = 25,
+        etag_cache_size: int = 256,
+    ) -> None:
+        super().__init__(token, base_url, etag_cache_size)
+        self.max_concurrency = max_concurrency
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=10.0,
+            headers=self._headers(token),
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30),
+        )
+        self._semaphore = anyio.Semaphore(self.max_concurrency)
+
+    async def _await_budget(self) -> None:
+        delay = _budget_wait(self.rate_limit_remaining, self.rate_limit_reset)
+        if delay:
+            logger.warning("github_rate_limit_wait", seconds=delay)
+            await _async_sleep(delay)
+
+    async def _request_with_retry(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Async twin of GitHubClient._request_with_retry; backoff yields the event loop."""
+        idempotent = method != "POST"
+        await self._await_budget()
+        for attempt in range(_MAX_ATTEMPTS - 1):
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, path, **kwargs)
+                self._update_rate_limits(response)
+                delay = _retry_delay(response, attempt, idempotent)
+                if delay is None:
+                    return response
+                logger.warning("github_api_retry", method=method, path=path, status=response.status_code)
+            except httpx.RequestError as e:
+                if not idempotent and not isinstance(e, _CONNECT_ERRORS):
+                    raise
+                logger.warning("github_api_retry", method=method, path=path, error=str(e))
+                delay = _backoff(attempt)
+            await _async_sleep(delay)
+        async with self._semaphore:
+            response = await self._client.request(method, path, **kwargs)
+        self._update_rate_limits(response)
+        return response
+
+    async def _request(self, method: str, path: str, payload: dict | None = None) -> httpx.Response:
+        kwargs, cached = self._prepare(method, path, payload)
+        try:
+            response = await self._request_with_retry(method, path, **kwargs)
+            return self._finish(method, path, response, cached)
+        except httpx.HTTPError as e:
+            self._fail(method, path, e)
+
+    async def get(self, path: str) -> httpx.Response:
+        return await self._request("GET", path)
+
+    async def post(self, path: str, payload: dict | None = None) -> httpx.Response:
+        return await self._request("POST", path, payload)
+
+    async def patch(self, path: str, payload: dict | None = None) -> httpx.Response:
+        return await self._request("PATCH", path, payload)
+
+    async def put(self, path: str, payload: dict | None = None) -> httpx.Response:
+        return await self._request("PUT", path, payload)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncGitHubClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
 
-__all__ = ["GitHubClient"]
+__all__ = ["AsyncGitHubClient", "GitHubClient"]
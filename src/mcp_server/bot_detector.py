@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 BOT_PATTERNS = [
     "[bot]",
     "-bot",
@@ -14,10 +16,12 @@ BOT_PATTERNS = [
 ]
 
 
+_BOT_RE = re.compile("|".join(re.escape(pattern) for pattern in BOT_PATTERNS), re.IGNORECASE)
+
+
 def is_bot(login: str) -> bool:
     """Detect if GitHub login is a bot."""
-    login_lower = login.lower()
-    return any(pattern in login_lower for pattern in BOT_PATTERNS)
+    return _BOT_RE.search(login) is not None
 
 
 __all__ = ["is_bot"]
@@ -5,14 +5,21 @@ from __future__ import annotations
 import asyncio
 import os
 
-from .logging_config import configure_logging
-from .server import run_stdio
-
 
 def main() -> None:
+    # Deferred so importing the module stays cheap; the server stack loads only when run
+    from .logging_config import configure_logging
+    from .server import run_stdio
+
     log_level = os.environ.get("LOG_LEVEL", "INFO")
     configure_logging(log_level)
-    asyncio.run(run_stdio())
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(run_stdio())
+        return
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(run_stdio())
 
 
 if __name__ == "__main__":
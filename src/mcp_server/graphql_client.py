@@ -2,47 +2,265 @@
 
 from __future__ import annotations
 
+import copy
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import TracebackType
 from typing import Any
 
+import anyio
 import httpx
+import orjson
 import structlog
 
-logger = structlog.get_logger(__name__)
+from .actions import _MAX_ATTEMPTS, _budget_wait, _retry_delay
+
+logger = structlog.get_logger(__name__, component="graphql_client")
+
+# Backoff waits go through this hook so tests can skip them without patching anyio
+_sleep = anyio.sleep
+
+CacheKey = tuple[str, str, str, int]
+
+
+def _compact(document: str) -> str:
+    """Collapse GraphQL whitespace so the JSON payload carries no indentation."""
+    return re.sub(r"\s+", " ", document).strip()
+
+
+_GET_PENDING_REVIEWS_QUERY = _compact("""
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviews(first: 10, states: [PENDING]) {
+        nodes {
+          id
+          databaseId
+          state
+          body
+          author {
+            login
+          }
+          comments(first: 10) {
+            nodes {
+              id
+              databaseId
+              body
+              path
+              line
+              originalLine
+              diffHunk
+              createdAt
+              author {
+                login
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
+
+_SUBMIT_REVIEW_MUTATION = _compact("""
+mutation($input: SubmitPullRequestReviewInput!) {
+  submitPullRequestReview(input: $input) {
+    pullRequestReview {
+      id
+      databaseId
+      state
+    }
+  }
+}
+""")
+
+_GET_REVIEW_THREADS_QUERY = _compact("""
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviewThreads(first: 100) {
+        nodes {
+          id
+          isResolved
+          comments(first: 20) {
+            nodes {
+              id
+              databaseId
+              body
+              path
+              line
+              author {
+                login
+              }
+              createdAt
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
+
+
+@dataclass(slots=True)
+class _InFlightQuery:
+    """A query being executed on behalf of every caller that asked for it."""
+
+    done: anyio.Event = field(default_factory=anyio.Event)
+    result: dict[str, Any] | None = None
+    error: Exception | None = None
 
 
 class GitHubGraphQLClient:
     """GitHub GraphQL API client for pending reviews and review threads."""
+
+    # Response header -> key in ``rate_limit``
+    _RL_FIELDS = (
+        ("x-ratelimit-limit", "limit"),
+        ("x-ratelimit-remaining", "remaining"),
+        ("x-ratelimit-used", "used"),
+        ("x-ratelimit-reset", "reset"),
+    )
     
-    def __init__(self, token: str):
+    def __init__(
+        self, token: str, cache_ttl: float = 30.0, cache_size: int = 512, max_concurrency: int = 8
+    ):
         self.token = token
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[tuple[str, bytes], _InFlightQuery] = {}
+        self.rate_limit: dict[str, int] = {}
+        # GraphQL has its own points budget, so it is throttled apart from the REST client
+        self._semaphore = anyio.Semaphore(max_concurrency)
         self.base_url = "https://api.github.com/graphql"
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        # Pool settings live on the transport, which also retries failed connects
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        )
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            headers=self.headers,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> GitHubGraphQLClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def _update_rate_limits(self, response: httpx.Response) -> None:
+        headers = response.headers
+        for header, key in self._RL_FIELDS:
+            value = headers.get(header)
+            if value is not None:
+                self.rate_limit[key] = int(value)
+
+    async def _await_budget(self) -> None:
+        delay = _budget_wait(self.rate_limit.get("remaining", 5000), self.rate_limit.get("reset", 0))
+        if delay:
+            logger.warning("github_graphql_rate_limit_wait", seconds=delay)
+            await _sleep(delay)
+
+    def _cache_get(self, key: CacheKey) -> dict[str, Any] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        # Callers annotate results in place, so never hand out the cached object
+        return copy.deepcopy(value)
+
+    def _cache_put(self, key: CacheKey, value: dict[str, Any]) -> None:
+        self._cache[key] = (time.monotonic(), copy.deepcopy(value))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, owner: str, repo: str, pr_number: int) -> None:
+        """Drop cached reads for a PR after it has been written to."""
+        for key in [k for k in self._cache if k[1:] == (owner, repo, pr_number)]:
+            del self._cache[key]
     
     async def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Execute GraphQL query."""
+        """Execute GraphQL query, sharing one request among concurrent identical queries."""
+        if query.lstrip().startswith("mutation"):
+            return await self._execute(query, variables)
+
+        key = (query, orjson.dumps(variables or {}, option=orjson.OPT_SORT_KEYS))
+        pending = self._inflight.get(key)
+        if pending is not None:
+            await pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.result is None:
+                # The leading caller was cancelled before finishing; run our own request
+                return await self.query(query, variables)
+            return copy.deepcopy(pending.result)
+
+        pending = self._inflight[key] = _InFlightQuery()
+        try:
+            pending.result = await self._execute(query, variables)
+            return pending.result
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            del self._inflight[key]
+            pending.done.set()
+
+    async def _execute(self, query: str, variables: dict[str, Any] | None) -> dict[str, Any]:
         payload: dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
         
+        body = orjson.dumps(payload)
+        # A mutation that hit a 5xx may already have been applied, so only rejections are retried
+        idempotent = not query.lstrip().startswith("mutation")
+        # Once, like the REST clients: retries already wait out the response that failed
+        await self._await_budget()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.base_url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30.0
+            for attempt in range(_MAX_ATTEMPTS):
+                async with self._semaphore:
+                    response = await self._client.post(self.base_url, content=body)
+                self._update_rate_limits(response)
+                delay = _retry_delay(response, attempt, idempotent)
+                if delay is None or attempt == _MAX_ATTEMPTS - 1:
+                    break
+                logger.warning(
+                    "github_graphql_retry", status=response.status_code, attempt=attempt + 1, delay=delay
                 )
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-                
-                if "errors" in result:
-                    error_msg = result["errors"][0].get("message", "Unknown GraphQL error")
-                    raise ValueError(f"GraphQL error: {error_msg}")
-                
-                return result
+                await _sleep(delay)
+            response.raise_for_status()
+            result: dict[str, Any] = orjson.loads(response.content)
+            
+            if "errors" in result:
+                error_msg = result["errors"][0].get("message", "Unknown GraphQL error")
+                raise ValueError(f"GraphQL error: {error_msg}")
+            
+            return result
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise ValueError("Invalid GitHub token") from e
@@ -56,40 +274,10 @@ class GitHubGraphQLClient:
     
     async def get_pending_reviews(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
         """Get pending reviews with inline comments."""
-        query = """
-        query($owner: String!, $repo: String!, $number: Int!) {
-          repository(owner: $owner, name: $repo) {
-            pullRequest(number: $number) {
-              reviews(first: 10, states: [PENDING]) {
-                nodes {
-                  id
-                  databaseId
-                  state
-                  body
-                  author {
-                    login
-                  }
-                  comments(first: 10) {
-                    nodes {
-                      id
-                      databaseId
-                      body
-                      path
-                      line
-                      originalLine
-                      diffHunk
-                      createdAt
-                      author {
-                        login
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        key = ("pending_reviews", owner, repo, pr_number)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
         variables = {
             "owner": owner,
@@ -97,7 +285,7 @@ class GitHubGraphQLClient:
             "number": pr_number
         }
         
-        result = await self.query(query, variables)
+        result = await self.query(_GET_PENDING_REVIEWS_QUERY, variables)
         
         if "errors" in result:
             logger.error("graphql_error", errors=result["errors"])
@@ -105,26 +293,17 @@ class GitHubGraphQLClient:
         
         reviews = result["data"]["repository"]["pullRequest"]["reviews"]["nodes"]
         
-        return {
+        data = {
             "pending_reviews": reviews,
             "count": len(reviews),
-            "has_comments": any(len(r["comments"]["nodes"]) > 0 for r in reviews)
+            "has_comments": any(r["comments"]["nodes"] for r in reviews)
         }
+        self._cache_put(key, data)
+        return data
     
     async def submit_pending_review(self, owner: str, repo: str, pr_number: int, 
                                   review_id: str, event: str, body: str = "") -> dict[str, Any]:
         """Submit pending review via GraphQL mutation."""
-        mutation = """
-        mutation($input: SubmitPullRequestReviewInput!) {
-          submitPullRequestReview(input: $input) {
-            pullRequestReview {
-              id
-              databaseId
-              state
-            }
-          }
-        }
-        """
         
         variables = {
             "input": {
@@ -134,7 +313,8 @@ class GitHubGraphQLClient:
             }
         }
         
-        result = await self.query(mutation, variables)
+        result = await self.query(_SUBMIT_REVIEW_MUTATION, variables)
+        self.invalidate(owner, repo, pr_number)
         
         if "errors" in result:
             return {"error": result["errors"]}
@@ -146,43 +326,22 @@ class GitHubGraphQLClient:
     
     async def get_review_threads(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
         """Get review threads with isResolved status."""
-        query = """
-        query($owner: String!, $repo: String!, $number: Int!) {
-          repository(owner: $owner, name: $repo) {
-            pullRequest(number: $number) {
-              reviewThreads(first: 100) {
-                nodes {
-                  id
-                  isResolved
-                  comments(first: 20) {
-                    nodes {
-                      id
-                      databaseId
-                      body
-                      path
-                      line
-                      author {
-                        login
-                      }
-                      createdAt
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        key = ("review_threads", owner, repo, pr_number)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
         variables = {"owner": owner, "repo": repo, "number": pr_number}
-        result = await self.query(query, variables)
+        result = await self.query(_GET_REVIEW_THREADS_QUERY, variables)
         
         if "errors" in result:
             logger.error("graphql_error", errors=result["errors"])
             return {"error": result["errors"]}
         
         threads = result["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
-        return {"threads": threads, "count": len(threads)}
+        data = {"threads": threads, "count": len(threads)}
+        self._cache_put(key, data)
+        return data
 
 
 __all__ = ["GitHubGraphQLClient"]
\ No newline at end of file
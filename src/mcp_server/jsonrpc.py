@@ -2,35 +2,130 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import os
+import stat
+import sys
+import traceback
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 import anyio
+import orjson
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 Handler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+# One outbound stdout line: a response, or the responses to a batch
+Frame = dict[str, Any] | list[dict[str, Any]]
+
+
+def _text_response(message_id: Any, text: str) -> dict[str, Any]:
+    """Wrap tool output as a single MCP text content block."""
+    return {"jsonrpc": "2.0", "id": message_id, "result": {"content": [{"type": "text", "text": text}]}}
+
+
+def _is_notification(message: Any) -> bool:
+    """JSON-RPC notifications carry no id and must never be replied to."""
+    return isinstance(message, dict) and "id" not in message
+
+
+def _encode(response: dict[str, Any]) -> bytes:
+    """Serialize one response; a result JSON cannot represent becomes a -32603 error."""
+    try:
+        return orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as e:
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": response.get("id"),
+            "error": {"code": -32603, "message": f"Unserializable response: {e}"},
+        })
+
+
+def _encode_frame(frame: Frame) -> bytes:
+    """Serialize a response or batch reply as one newline-terminated stdout line."""
+    if isinstance(frame, list):
+        return b"[" + b",".join(map(_encode, frame)) + b"]\n"
+    return _encode(frame) + b"\n"
+
+
+def _stdin_fd() -> int | None:
+    """Return the stdin descriptor when it is a pipe or socket we can poll."""
+    try:
+        fd = sys.stdin.fileno()
+        mode = os.fstat(fd).st_mode
+    except (AttributeError, OSError, ValueError):
+        return None
+    if sys.platform == "win32" or not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+        return None
+    return fd
+
+
+async def _stdin_lines() -> AsyncIterator[str | bytes]:
+    """Yield stdin lines, polling the descriptor instead of using a worker thread.
+
+    Regular files, terminals and Windows pipes cannot be polled portably, so
+    those fall back to a thread-offloaded ``readline``.
+    """
+    fd = _stdin_fd()
+    if fd is None:
+        while line := await anyio.to_thread.run_sync(sys.stdin.readline):
+            yield line
+        return
+
+    blocking = os.get_blocking(fd)
+    os.set_blocking(fd, False)
+    pending = b""
+    try:
+        while True:
+            await anyio.wait_readable(fd)
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
+    finally:
+        os.set_blocking(fd, blocking)
 
 
 @dataclass(slots=True)
 class JSONRPCServer:
     handlers: dict[str, Handler]
     schemas: dict[str, dict[str, Any]] | None = None
+    _protocol: dict[str, Handler] = field(init=False, repr=False)
+    _tools: list[dict[str, Any]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # MCP protocol methods, checked before the tool handlers
+        self._protocol = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        }
+        schemas = self.schemas or {}
+        self._tools = [
+            {
+                "name": name,
+                "description": f"MCP tool: {name}",
+                "inputSchema": schemas.get(name, {"type": "object", "properties": {}}),
+            }
+            for name in self.handlers
+        ]
 
     async def handle(self, message: dict[str, Any]) -> dict[str, Any]:
         if "method" not in message:
             raise ValueError("Invalid JSON-RPC request")
         method = message["method"]
-        
-        # Handle MCP protocol methods
-        match method:
-            case "initialize":
-                return await self._handle_initialize(message)
-            case "tools/list":
-                return await self._handle_tools_list(message)
-            case "tools/call":
-                return await self._handle_tools_call(message)
-        
+
+        protocol = self._protocol.get(method)
+        if protocol is not None:
+            return await protocol(message)
+
         handler = self.handlers.get(method)
         if handler is None:
             raise ValueError(f"Unknown method: {method}")
@@ -50,72 +145,107 @@ class JSONRPCServer:
         }
     
     async def _handle_tools_list(self, message: dict[str, Any]) -> dict[str, Any]:
-        tools = []
-        for name, _handler in self.handlers.items():
-            tool: dict[str, Any] = {"name": name, "description": f"MCP tool: {name}"}
-            if self.schemas and name in self.schemas:
-                tool["inputSchema"] = self.schemas[name]
-            else:
-                tool["inputSchema"] = {"type": "object", "properties": {}}
-            tools.append(tool)
-        return {"jsonrpc": "2.0", "id": message.get("id"), "result": {"tools": tools}}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": {"tools": self._tools}}
     
     async def _handle_tools_call(self, message: dict[str, Any]) -> dict[str, Any]:
-        params = message.get("params", {})
-        tool_name = params.get("name")
-        tool_args = params.get("arguments", {})
-        
-        if tool_name not in self.handlers:
+        params = message.get("params") or {}
+        tool_name = params.get("name", "")
+        handler = self.handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
-        
-        result = await self.handlers[tool_name](tool_args)
-        return {
-            "jsonrpc": "2.0",
-            "id": message.get("id"),
-            "result": {"content": [{"type": "text", "text": str(result)}]}
-        }
+
+        result = await handler(params.get("arguments") or {})
+        # Non-JSON values and dict keys fall back to str(), as the text block used to
+        return _text_response(
+            message.get("id"), orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        )
 
     async def serve_stdio(self) -> None:
-        import sys
-        while True:
+        """Serve stdin/stdout, handling requests concurrently as they arrive.
+
+        Each line is dispatched in its own task so a slow tool call does not
+        hold up the next request; a single writer task owns stdout.
+        """
+        send, receive = anyio.create_memory_object_stream[bytes](64)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._write_responses, receive)
+            async with send:
+                async for line in _stdin_lines():
+                    line = line.strip()
+                    if line:
+                        tg.start_soon(self._handle_line, line, send.clone())
+
+    async def _handle_line(self, line: str | bytes, send: MemoryObjectSendStream[bytes]) -> None:
+        async with send:
             try:
-                line = await anyio.to_thread.run_sync(sys.stdin.readline)
-                if not line:
-                    break
-                line = line.strip()
-                if not line:
-                    continue
-                message = json.loads(line)
-                response = await self.handle(message)
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
-            except (EOFError, KeyboardInterrupt):
-                break
-            except json.JSONDecodeError as e:
-                error_response = {
+                message = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                await send.send(_encode_frame({
                     "jsonrpc": "2.0",
                     "id": None,
                     "error": {"code": -32700, "message": f"Parse error: {e}"}
+                }))
+                return
+            if isinstance(message, list):
+                responses = await self._handle_batch(message)
+                if responses:  # a batch of only notifications gets no reply
+                    await send.send(_encode_frame(responses))
+            else:
+                response = await self._respond(message)
+                if not _is_notification(message):
+                    # Serialized here, not in the writer, so a bad result only fails its own request
+                    await send.send(_encode_frame(response))
+
+    async def _handle_batch(self, batch: list[Any]) -> Frame:
+        """Run a JSON-RPC batch concurrently; replies keep request order, minus notifications."""
+        if not batch:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+        responses: list[dict[str, Any]] = [{}] * len(batch)
+
+        async def run(index: int, message: Any) -> None:
+            responses[index] = await self._respond(message)
+
+        async with anyio.create_task_group() as tg:
+            for index, message in enumerate(batch):
+                tg.start_soon(run, index, message)
+        return [
+            response
+            for message, response in zip(batch, responses, strict=True)
+            if not _is_notification(message)
+        ]
+
+    async def _respond(self, message: Any) -> dict[str, Any]:
+        """Handle one request, turning any failure into a JSON-RPC error response."""
+        try:
+            return await self.handle(message)
+        except Exception as e:
+            # Capture more detailed error information
+            error_detail = f"{type(e).__name__}: {str(e)}"
+            if e.__cause__:
+                error_detail += f" (caused by: {type(e.__cause__).__name__}: {str(e.__cause__)})"
+
+            return {
+                "jsonrpc": "2.0",
+                "id": message.get("id") if isinstance(message, dict) else None,
+                "error": {
+                    "code": -32603,
+                    "message": error_detail,
+                    "data": traceback.format_exc()[-1000:]  # Last 1000 chars of traceback
                 }
-                sys.stdout.write(json.dumps(error_response) + "\n")
-                sys.stdout.flush()
-                continue
-            except Exception as e:
-                # Capture more detailed error information
-                import traceback
-                error_detail = f"{type(e).__name__}: {str(e)}"
-                if hasattr(e, '__cause__') and e.__cause__:
-                    error_detail += f" (caused by: {type(e.__cause__).__name__}: {str(e.__cause__)})"
-                
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": message.get("id") if "message" in locals() else None,
-                    "error": {
-                        "code": -32603, 
-                        "message": error_detail,
-                        "data": traceback.format_exc()[-1000:]  # Last 1000 chars of traceback
-                    }
-                }
-                sys.stdout.write(json.dumps(error_response) + "\n")
-                sys.stdout.flush()
+            }
 
+    @staticmethod
+    async def _write_responses(receive: MemoryObjectReceiveStream[bytes]) -> None:
+        out = sys.stdout.buffer
+        write, flush = out.write, out.flush
+        async with receive:
+            async for frame in receive:
+                write(frame)
+                # Coalesce whatever else is already queued into one flush
+                while True:
+                    try:
+                        frame = receive.receive_nowait()
+                    except (anyio.WouldBlock, anyio.EndOfStream):
+                        break
+                    write(frame)
+                flush()
@@ -3,23 +3,28 @@
 import logging
 import sys
 
+import orjson
 import structlog
 
 
 def configure_logging(log_level: str = "INFO") -> None:
     """Configure structlog for production use."""
+    level = logging.getLevelName(log_level.upper())
+    processors: list[structlog.typing.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+    if level <= logging.DEBUG:
+        # Only debugging sessions log with stack_info/exc_info; skip the work otherwise
+        processors += [structlog.processors.StackInfoRenderer(), structlog.processors.format_exc_info]
+    processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(log_level)),
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=structlog.BytesLoggerFactory(file=sys.stderr.buffer),
         cache_logger_on_first_use=True,
     )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Sequence
 from enum import Enum
 
@@ -186,8 +187,12 @@ class SubmitPendingReviewRequest(BaseModel):
     body: str = ""
 
 
+@functools.cache
 def schema_for(model: type[BaseModel]) -> dict:
-    """Return JSON schema for a model."""
+    """Return JSON schema for a model.
+
+    Schemas are generated once per model and shared; treat the result as read-only.
+    """
 
     return model.model_json_schema()
 
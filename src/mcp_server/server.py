@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import subprocess
-from collections.abc import Callable, Coroutine
 from configparser import ConfigParser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 import structlog
 
-from .actions import GitHubClient
+from .actions import AsyncGitHubClient
 from .bot_detector import is_bot
 from .graphql_client import GitHubGraphQLClient
 from .jsonrpc import JSONRPCServer
@@ -22,17 +24,69 @@ from .schemas import SubmitPendingReviewRequest, schema_for
 logger = structlog.get_logger(__name__)
 
 
+@functools.cache
+def _tool_schemas() -> dict:
+    """Tool input schemas; static, so built once and shared by every server."""
+    return {
+        "review_pr": {
+            "type": "object",
+            "properties": {"pr_number": {"type": "integer"}},
+            "required": ["pr_number"]
+        },
+        "reply_to_comment": {
+            "type": "object",
+            "properties": {
+                "pr_number": {"type": "integer"},
+                "comment_id": {"type": "string"},
+                "reply_text": {"type": "string"}
+            },
+            "required": ["pr_number", "comment_id", "reply_text"]
+        },
+        "get_review_threads": {
+            "type": "object",
+            "properties": {"pr_number": {"type": "integer"}},
+            "required": ["pr_number"]
+        },
+        "submit_pending_review": schema_for(SubmitPendingReviewRequest),
+        "list_issues": {
+            "type": "object",
+            "properties": {
+                "state": {"type": "string", "enum": ["open", "closed", "all"]}
+            }
+        },
+        "review_issue": {
+            "type": "object",
+            "properties": {"issue_number": {"type": "integer"}},
+            "required": ["issue_number"]
+        },
+        "reply_to_issue_comment": {
+            "type": "object",
+            "properties": {
+                "issue_number": {"type": "integer"},
+                "reply_text": {"type": "string"}
+            },
+            "required": ["issue_number", "reply_text"]
+        },
+        "health": {"type": "object", "properties": {}}
+    }
+
+
 @dataclass(slots=True)
 class MCPServer:
     """MCP server with 8 tools: 5 PR + 3 issues + health."""
     
     token: str
-    client: GitHubClient
+    client: AsyncGitHubClient
     graphql: GitHubGraphQLClient
+    # Fixed for the life of the process, so detected/fetched once
+    _repo: tuple[str, str] | None = field(default=None, init=False, repr=False)
+    _login: str | None = field(default=None, init=False, repr=False)
+    _login_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _handlers: dict | None = field(default=None, init=False, repr=False)
     
     @classmethod
     def create(cls, token: str) -> MCPServer:
-        client = GitHubClient(token=token)
+        client = AsyncGitHubClient(token=token)
         graphql = GitHubGraphQLClient(token=token)
         return cls(token=token, client=client, graphql=graphql)
 
@@ -65,6 +119,12 @@ class MCPServer:
         return None
 
     def _get_repo(self) -> tuple[str, str]:
+        """Get owner/repo, detecting it on first use."""
+        if self._repo is None:
+            self._repo = self._detect_repo()
+        return self._repo
+
+    def _detect_repo(self) -> tuple[str, str]:
         """Get owner/repo from git remote or GITHUB_REPOSITORY env var."""
         # Try git remote first - search from source file location
         source_dir = Path(__file__).parent.parent.parent  # src/mcp_server/server.py -> repo root
@@ -76,7 +136,9 @@ class MCPServer:
                 config_path = current / ".git" / "config"
                 if config_path.exists():
                     try:
-                        config = ConfigParser()
+                        # Real git configs repeat keys (e.g. several fetch refspecs) and
+                        # URL-encode with %, which a strict, interpolating parser rejects
+                        config = ConfigParser(strict=False, interpolation=None)
                         config.read(config_path)
                         origin_section = 'remote "origin"'
                         if config.has_section(origin_section):
@@ -86,22 +148,23 @@ class MCPServer:
                                 if parsed:
                                     return parsed
                     except (OSError, Exception) as e:
-                        # Config parsing failed - continue to git command fallback
+                        # Config parsing failed - continue to env var fallback
                         logger.debug("git_config_parse_failed", error=str(e))
-
-                try:
-                    result = subprocess.run(
-                        ["git", "remote", "get-url", "origin"],
-                        cwd=current, capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0:
-                        url = result.stdout.strip()
-                        parsed = self._parse_repo_from_url(url)
-                        if parsed:
-                            return parsed
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                    # Git command failed - continue to env var fallback
-                    pass
+                else:
+                    # .git is a file in worktrees and submodules; only git can resolve it
+                    try:
+                        result = subprocess.run(
+                            ["git", "remote", "get-url", "origin"],
+                            cwd=current, capture_output=True, text=True, timeout=5
+                        )
+                        if result.returncode == 0:
+                            url = result.stdout.strip()
+                            parsed = self._parse_repo_from_url(url)
+                            if parsed:
+                                return parsed
+                    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
+                        # Git command failed - continue to env var fallback
+                        pass
                 break
             if current.parent == current:
                 break
@@ -123,22 +186,29 @@ class MCPServer:
             "Either run from a git repository with GitHub remote or set GITHUB_REPOSITORY=owner/repo"
         )
     
+    async def _get_authenticated_user(self) -> str:
+        """Login of the token owner, fetched once and shared by concurrent callers."""
+        if self._login is None:
+            async with self._login_lock:
+                if self._login is None:
+                    response = await self.client.get("/user")
+                    self._login = orjson.loads(response.content)["login"]
+        return self._login
+
     async def review_pr(self, params: dict[str, Any]) -> dict[str, Any]:
         """Get PR with threads (GraphQL) + reviews (REST)."""
         pr_number = params["pr_number"]
         owner, repo = self._get_repo()
         logger.info("review_pr_start", pr_number=pr_number, owner=owner, repo=repo)
         
-        # Get authenticated user
-        user_response = self.client.get("/user")
-        authenticated_user = user_response.json()["login"]
-        
-        # GraphQL: threads with isResolved
-        threads_data = await self.graphql.get_review_threads(owner, repo, pr_number)
-        
-        # REST: PR info + reviews
-        pr_response = self.client.get(f"/repos/{owner}/{repo}/pulls/{pr_number}")
-        reviews_response = self.client.get(f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews")
+        # Independent fetches run concurrently: authenticated user, GraphQL threads
+        # with isResolved, and REST PR info + reviews
+        authenticated_user, threads_data, pr_response, reviews_response = await asyncio.gather(
+            self._get_authenticated_user(),
+            self.graphql.get_review_threads(owner, repo, pr_number),
+            self.client.get(f"/repos/{owner}/{repo}/pulls/{pr_number}"),
+            self.client.get(f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews"),
+        )
         
         # Annotate threads with bot detection and own comment detection
         threads = threads_data.get("threads", [])
@@ -157,8 +227,8 @@ class MCPServer:
             authenticated_user=authenticated_user,
         )
         return {
-            "pr_info": pr_response.json(),
-            "reviews": reviews_response.json(),
+            "pr_info": orjson.loads(pr_response.content),
+            "reviews": orjson.loads(reviews_response.content),
             "threads": threads,
             "threads_count": threads_data.get("count", 0),
             "authenticated_user": authenticated_user,
@@ -182,7 +252,8 @@ class MCPServer:
         path = f"/repos/{owner}/{repo}/pulls/{pr_number}/comments"
         payload = {"body": reply_text, "in_reply_to": database_id}
         
-        self.client.post(path, payload=payload)
+        await self.client.post(path, payload=payload)
+        self.graphql.invalidate(owner, repo, pr_number)
         logger.info("reply_to_comment_success", pr_number=pr_number, comment_id=database_id)
         return {"success": True}
     
@@ -209,8 +280,8 @@ class MCPServer:
         
         try:
             # Get all issues (includes PRs)
-            response = self.client.get(f"/repos/{owner}/{repo}/issues?state={state}&per_page=100")
-            all_items = response.json()
+            response = await self.client.get(f"/repos/{owner}/{repo}/issues?state={state}&per_page=100")
+            all_items = orjson.loads(response.content)
             
             # Filter out PRs - only keep real issues
             issues = [
@@ -234,25 +305,24 @@ class MCPServer:
         logger.info("review_issue_start", issue_number=issue_number, owner=owner, repo=repo)
         
         try:
-            # Get authenticated user
-            user_response = self.client.get("/user")
-            authenticated_user = user_response.json()["login"]
-            
-            # Get issue + comments
-            issue_response = self.client.get(f"/repos/{owner}/{repo}/issues/{issue_number}")
-            comments_response = self.client.get(f"/repos/{owner}/{repo}/issues/{issue_number}/comments")
+            # Authenticated user, issue and comments are independent reads
+            authenticated_user, issue_response, comments_response = await asyncio.gather(
+                self._get_authenticated_user(),
+                self.client.get(f"/repos/{owner}/{repo}/issues/{issue_number}"),
+                self.client.get(f"/repos/{owner}/{repo}/issues/{issue_number}/comments"),
+            )
         except Exception as e:
             logger.error("review_issue_failed", issue_number=issue_number, error=str(e))
             raise
         
-        issue_data = issue_response.json()
+        issue_data = orjson.loads(issue_response.content)
         
         # GitHub /issues endpoint returns both issues and PRs
         # Reject PRs - only accept real issues
         if "pull_request" in issue_data and issue_data["pull_request"] is not None:
             raise ValueError(f"#{issue_number} is a pull request, not an issue. Use review_pr instead.")
         
-        comments = comments_response.json()
+        comments = orjson.loads(comments_response.content)
         
         # Annotate comments with bot detection and own comment detection
         for comment in comments:
@@ -295,7 +365,7 @@ class MCPServer:
             path = f"/repos/{owner}/{repo}/issues/{issue_number}/comments"
             payload = {"body": reply_text}
             
-            response = self.client.post(path, payload=payload)
+            response = await self.client.post(path, payload=payload)
             response.raise_for_status()
             logger.info("reply_to_issue_comment_success", issue_number=issue_number)
             return {"success": True}
@@ -310,73 +380,31 @@ class MCPServer:
             "rate_limit": {
                 "remaining": self.client.rate_limit_remaining,
                 "reset": self.client.rate_limit_reset
-            }
+            },
+            "graphql_rate_limit": self.graphql.rate_limit,
         }
     
     def handlers(self) -> dict:
-        """JSON-RPC handlers."""
+        """JSON-RPC handlers, built once per server."""
+        if self._handlers is None:
+            self._handlers = self._build_handlers()
+        return self._handlers
+
+    def _build_handlers(self) -> dict:
         return {
-            "review_pr": self._wrap(self.review_pr),
-            "reply_to_comment": self._wrap(self.reply_to_comment),
-            "get_review_threads": self._wrap(self.get_review_threads),
-            "submit_pending_review": self._wrap(self.submit_pending_review),
-            "list_issues": self._wrap(self.list_issues),
-            "review_issue": self._wrap(self.review_issue),
-            "reply_to_issue_comment": self._wrap(self.reply_to_issue_comment),
-            "health": self._wrap(self.health),
+            "review_pr": self.review_pr,
+            "reply_to_comment": self.reply_to_comment,
+            "get_review_threads": self.get_review_threads,
+            "submit_pending_review": self.submit_pending_review,
+            "list_issues": self.list_issues,
+            "review_issue": self.review_issue,
+            "reply_to_issue_comment": self.reply_to_issue_comment,
+            "health": self.health,
         }
     
-    def _wrap(
-        self, func: Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]
-    ) -> Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]:
-        async def wrapper(params: dict[str, Any]) -> dict[str, Any]:
-            return await func(params)
-        return wrapper
-    
     def schemas(self) -> dict:
         """Tool schemas."""
-        return {
-            "review_pr": {
-                "type": "object",
-                "properties": {"pr_number": {"type": "integer"}},
-                "required": ["pr_number"]
-            },
-            "reply_to_comment": {
-                "type": "object",
-                "properties": {
-                    "pr_number": {"type": "integer"},
-                    "comment_id": {"type": "string"},
-                    "reply_text": {"type": "string"}
-                },
-                "required": ["pr_number", "comment_id", "reply_text"]
-            },
-            "get_review_threads": {
-                "type": "object",
-                "properties": {"pr_number": {"type": "integer"}},
-                "required": ["pr_number"]
-            },
-            "submit_pending_review": schema_for(SubmitPendingReviewRequest),
-            "list_issues": {
-                "type": "object",
-                "properties": {
-                    "state": {"type": "string", "enum": ["open", "closed", "all"]}
-                }
-            },
-            "review_issue": {
-                "type": "object",
-                "properties": {"issue_number": {"type": "integer"}},
-                "required": ["issue_number"]
-            },
-            "reply_to_issue_comment": {
-                "type": "object",
-                "properties": {
-                    "issue_number": {"type": "integer"},
-                    "reply_text": {"type": "string"}
-                },
-                "required": ["issue_number", "reply_text"]
-            },
-            "health": {"type": "object", "properties": {}}
-        }
+        return _tool_schemas()
     
     async def serve_stdio(self) -> None:
         """Serve via stdio."""
@@ -391,7 +419,11 @@ async def run_stdio() -> None:
         raise ValueError("GITHUB_TOKEN environment variable required")
     
     server = MCPServer.create(token)
-    await server.serve_stdio()
+    try:
+        await server.serve_stdio()
+    finally:
+        await server.client.aclose()
+        await server.graphql.aclose()
 
 
 __all__ = ["MCPServer", "run_stdio"]
@@ -0,0 +1,17 @@
+import anyio
+import pytest
+
+import mcp_server.actions as actions_module
+import mcp_server.graphql_client as graphql_module
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch):
+    """Keep retry backoff from slowing the suite down."""
+
+    async def fast_sleep(_seconds):
+        await anyio.lowlevel.checkpoint()
+
+    monkeypatch.setattr(actions_module, "_sleep", lambda _seconds: None)
+    monkeypatch.setattr(actions_module, "_async_sleep", fast_sleep)
+    monkeypatch.setattr(graphql_module, "_sleep", fast_sleep)
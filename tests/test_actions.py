@@ -1,7 +1,11 @@
+import asyncio
+import json
+
+import pytest
 import respx
 from httpx import Response
 
-from mcp_server.actions import GitHubClient
+from mcp_server.actions import AsyncGitHubClient, GitHubClient
 
 
 @respx.mock
@@ -13,3 +17,128 @@ def test_github_client_post():
     response = client.post("/repos/acme/demo/issues/1/labels", payload={"labels": ["bug"]})
     assert response.status_code == 200
     assert route.called
+    request = route.calls.last.request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"labels": ["bug"]}
+
+
+def test_github_client_context_manager_closes_pool():
+    with GitHubClient(token="test_token") as client:
+        assert not client._client.is_closed
+    assert client._client.is_closed
+
+
+@respx.mock
+async def test_async_client_gather_preserves_order():
+    client = AsyncGitHubClient(token="test_token", max_concurrency=2)
+    for number in (1, 2, 3):
+        respx.get(f"https://api.github.com/repos/acme/demo/pulls/{number}").mock(
+            return_value=Response(200, json={"number": number})
+        )
+    responses = await asyncio.gather(
+        *(client.get(f"/repos/acme/demo/pulls/{number}") for number in (1, 2, 3))
+    )
+    assert [r.json()["number"] for r in responses] == [1, 2, 3]
+    await client.aclose()
+
+
+@respx.mock
+async def test_async_client_maps_http_errors():
+    client = AsyncGitHubClient(token="test_token")
+    respx.get("https://api.github.com/user").mock(
+        return_value=Response(401, json={"message": "Bad credentials"})
+    )
+    with pytest.raises(ValueError, match="Invalid GitHub token.*Bad credentials"):
+        await client.get("/user")
+    await client.aclose()
+
+
+@respx.mock
+def test_github_client_get_uses_etag_cache():
+    client = GitHubClient(token="test_token")
+    route = respx.get("https://api.github.com/repos/acme/demo/pulls/1/reviews").mock(
+        side_effect=[
+            Response(200, json=[{"id": 1}], headers={"ETag": '"abc"'}),
+            Response(304),
+        ]
+    )
+    first = client.get("/repos/acme/demo/pulls/1/reviews")
+    second = client.get("/repos/acme/demo/pulls/1/reviews")
+    assert second.json() == first.json() == [{"id": 1}]
+    assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+
+@respx.mock
+def test_github_client_write_invalidates_etag_cache():
+    client = GitHubClient(token="test_token")
+    path = "/repos/acme/demo/issues/1/comments"
+    get_route = respx.get(f"https://api.github.com{path}").mock(
+        return_value=Response(200, json=[], headers={"ETag": '"abc"'})
+    )
+    respx.post(f"https://api.github.com{path}").mock(return_value=Response(201, json={}))
+    client.get(path)
+    client.post(path, payload={"body": "hi"})
+    client.get(path)
+    assert "If-None-Match" not in get_route.calls[1].request.headers
+
+
+@respx.mock
+async def test_async_client_get_uses_etag_cache():
+    client = AsyncGitHubClient(token="test_token")
+    path = "/repos/acme/demo/pulls/1/reviews"
+    route = respx.get(f"https://api.github.com{path}").mock(
+        side_effect=[
+            Response(200, json=[{"id": 1}], headers={"ETag": '"abc"'}),
+            Response(304),
+            Response(200, json=[{"id": 2}], headers={"ETag": '"def"'}),
+        ]
+    )
+    respx.post(f"https://api.github.com{path}").mock(return_value=Response(200, json={}))
+    first = await client.get(path)
+    second = await client.get(path)
+    await client.post(path, payload={"event": "COMMENT"})
+    third = await client.get(path)
+    assert second.json() == first.json() == [{"id": 1}]
+    assert third.json() == [{"id": 2}]
+    assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+    assert "If-None-Match" not in route.calls[2].request.headers
+    await client.aclose()
+
+
+@respx.mock
+def test_github_client_tracks_rate_limit_headers():
+    client = GitHubClient(token="test_token")
+    respx.get("https://api.github.com/user").mock(
+        return_value=Response(
+            200,
+            json={"login": "octocat"},
+            headers={"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "1700000000"},
+        )
+    )
+    client.get("/user")
+    assert client.rate_limit_remaining == 42
+    assert client.rate_limit_reset == 1700000000
+
+
+@respx.mock
+async def test_async_client_retries_server_errors():
+    client = AsyncGitHubClient(token="test_token")
+    route = respx.get("https://api.github.com/user").mock(
+        side_effect=[Response(503), Response(200, json={"login": "octocat"})]
+    )
+    response = await client.get("/user")
+    assert response.json() == {"login": "octocat"}
+    assert route.call_count == 2
+    await client.aclose()
+
+
+@respx.mock
+async def test_async_client_does_not_retry_post_server_errors():
+    client = AsyncGitHubClient(token="test_token")
+    route = respx.post("https://api.github.com/repos/acme/demo/issues/1/comments").mock(
+        return_value=Response(503)
+    )
+    with pytest.raises(ValueError, match="503"):
+        await client.post("/repos/acme/demo/issues/1/comments", payload={"body": "hi"})
+    assert route.call_count == 1
+    await client.aclose()
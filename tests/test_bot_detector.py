@@ -6,5 +6,6 @@ def test_bot_detection():
     assert is_bot("renovate[bot]") is True
     assert is_bot("github-actions[bot]") is True
     assert is_bot("codecov-bot") is True
+    assert is_bot("Renovate") is True
     assert is_bot("alice") is False
     assert is_bot("john-doe") is False
@@ -1,7 +1,9 @@
+import httpx
 import pytest
 import respx
 from httpx import Response
 
+import mcp_server.actions as actions_module
 from mcp_server.actions import GitHubClient
 
 
@@ -59,3 +61,126 @@ def test_connection_failed():
     
     with pytest.raises(ValueError, match="connection failed"):
         client.get("/user")
+
+
+@respx.mock
+def test_server_error_is_retried():
+    client = GitHubClient(token="test_token")
+    route = respx.get("https://api.github.com/user").mock(
+        side_effect=[Response(502), Response(200, json={"login": "octocat"})]
+    )
+
+    assert client.get("/user").json() == {"login": "octocat"}
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_client_error_is_not_retried():
+    client = GitHubClient(token="test_token")
+    route = respx.get("https://api.github.com/repos/owner/repo").mock(
+        return_value=Response(404, json={"message": "Not Found"})
+    )
+
+    with pytest.raises(ValueError, match="Resource not found"):
+        client.get("/repos/owner/repo")
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_retry_after_header_sets_backoff(monkeypatch):
+    client = GitHubClient(token="test_token")
+    sleeps: list[float] = []
+    monkeypatch.setattr(actions_module, "_sleep", sleeps.append)
+    respx.get("https://api.github.com/user").mock(
+        side_effect=[
+            Response(429, headers={"Retry-After": "7"}),
+            Response(200, json={"login": "octocat"}),
+        ]
+    )
+
+    assert client.get("/user").json() == {"login": "octocat"}
+    assert sleeps == [7.0]
+
+
+@respx.mock
+def test_exhausted_budget_waits_for_reset(monkeypatch):
+    client = GitHubClient(token="test_token")
+    sleeps: list[float] = []
+    monkeypatch.setattr(actions_module, "_sleep", sleeps.append)
+    reset = int(actions_module.time.time()) + 30
+    respx.get("https://api.github.com/user").mock(
+        return_value=Response(
+            200,
+            json={"login": "octocat"},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+        )
+    )
+
+    client.get("/user")
+    assert sleeps == []
+    client.get("/user")
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 30
+
+
+COMMENTS_URL = "https://api.github.com/repos/owner/repo/issues/1/comments"
+
+
+@respx.mock
+def test_post_server_error_is_not_retried():
+    client = GitHubClient(token="test_token")
+    route = respx.post(COMMENTS_URL).mock(return_value=Response(502))
+
+    with pytest.raises(ValueError, match="502"):
+        client.post("/repos/owner/repo/issues/1/comments", payload={"body": "hi"})
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_post_is_retried_when_rejected_or_never_sent():
+    client = GitHubClient(token="test_token")
+    route = respx.post(COMMENTS_URL).mock(
+        side_effect=[
+            Response(429, headers={"Retry-After": "1"}),
+            httpx.ConnectError("refused"),
+            Response(201, json={"id": 1}),
+        ]
+    )
+
+    client.post("/repos/owner/repo/issues/1/comments", payload={"body": "hi"})
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_post_read_timeout_is_not_retried():
+    client = GitHubClient(token="test_token")
+    route = respx.post(COMMENTS_URL).mock(side_effect=httpx.ReadTimeout("slow"))
+
+    with pytest.raises(ValueError, match="connection failed"):
+        client.post("/repos/owner/repo/issues/1/comments", payload={"body": "hi"})
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_far_budget_reset_fails_fast(monkeypatch):
+    client = GitHubClient(token="test_token")
+    sleeps: list[float] = []
+    monkeypatch.setattr(actions_module, "_sleep", sleeps.append)
+    reset = str(int(actions_module.time.time()) + 3600)
+    route = respx.get("https://api.github.com/user").mock(
+        return_value=Response(
+            403,
+            json={"message": "API rate limit exceeded"},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+        )
+    )
+
+    # The rejection itself is not retried...
+    with pytest.raises(ValueError, match="rate limit exceeded"):
+        client.get("/user")
+    assert route.call_count == 1
+
+    # ...and later requests are not sent while the budget is known to be spent
+    with pytest.raises(ValueError, match="rate limit exceeded"):
+        client.get("/user")
+    assert route.call_count == 1
+    assert sleeps == []
@@ -0,0 +1,240 @@
+import time
+
+import anyio
+import pytest
+import respx
+import structlog
+from httpx import Response
+
+import mcp_server.graphql_client as graphql_module
+from mcp_server.graphql_client import GitHubGraphQLClient
+from mcp_server.logging_config import configure_logging
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+def threads_payload(thread_id: str) -> dict:
+    thread = {"id": thread_id, "isResolved": False, "comments": {"nodes": []}}
+    return {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": [thread]}}}}}
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_review_threads_are_cached():
+    client = GitHubGraphQLClient(token="test_token")
+    route = respx.post(GRAPHQL_URL).mock(return_value=Response(200, json=threads_payload("T1")))
+
+    first = await client.get_review_threads("acme", "demo", 1)
+    first["threads"][0]["isResolved"] = True  # callers mutate results in place
+    second = await client.get_review_threads("acme", "demo", 1)
+
+    assert route.call_count == 1
+    assert second["threads"][0]["isResolved"] is False
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_cache_expires_and_invalidates():
+    client = GitHubGraphQLClient(token="test_token", cache_ttl=0)
+    route = respx.post(GRAPHQL_URL).mock(return_value=Response(200, json=threads_payload("T1")))
+
+    await client.get_review_threads("acme", "demo", 1)
+    await client.get_review_threads("acme", "demo", 1)
+    assert route.call_count == 2
+
+    client.cache_ttl = 30
+    await client.get_review_threads("acme", "demo", 1)
+    client.invalidate("acme", "demo", 1)
+    await client.get_review_threads("acme", "demo", 1)
+    assert route.call_count == 3
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_concurrent_identical_queries_share_one_request():
+    client = GitHubGraphQLClient(token="test_token")
+    release = anyio.Event()
+
+    async def slow_response(request):
+        await release.wait()
+        return Response(200, json={"data": {"viewer": {"login": "me"}}})
+
+    route = respx.post(GRAPHQL_URL).mock(side_effect=slow_response)
+    results = []
+
+    async def run_query():
+        results.append(await client.query("query { viewer { login } }"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(run_query)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert route.call_count == 1
+    assert results == [{"data": {"viewer": {"login": "me"}}}] * 3
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_rate_limit_headers_are_tracked():
+    client = GitHubGraphQLClient(token="test_token")
+    headers = {"X-RateLimit-Remaining": "4990", "X-RateLimit-Reset": "1700000000", "X-RateLimit-Used": "10"}
+    respx.post(GRAPHQL_URL).mock(return_value=Response(200, json=threads_payload("T1"), headers=headers))
+
+    await client.get_review_threads("acme", "demo", 1)
+
+    assert client.rate_limit == {"remaining": 4990, "reset": 1700000000, "used": 10}
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_query_retries_transient_server_errors():
+    client = GitHubGraphQLClient(token="test_token")
+    route = respx.post(GRAPHQL_URL).mock(
+        side_effect=[Response(502), Response(200, json=threads_payload("T1"))]
+    )
+
+    result = await client.get_review_threads("acme", "demo", 1)
+
+    assert route.call_count == 2
+    assert result["count"] == 1
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_mutation_is_not_retried_on_server_error():
+    client = GitHubGraphQLClient(token="test_token")
+    route = respx.post(GRAPHQL_URL).mock(return_value=Response(502))
+
+    with pytest.raises(ValueError, match="502"):
+        await client.submit_pending_review("acme", "demo", 1, "R1", "comment")
+
+    assert route.call_count == 1
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_query_waits_out_exhausted_rate_limit():
+    client = GitHubGraphQLClient(token="test_token")
+    limited = Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"})
+    route = respx.post(GRAPHQL_URL).mock(
+        side_effect=[limited, Response(200, json=threads_payload("T1"))]
+    )
+
+    await client.get_review_threads("acme", "demo", 1)
+
+    assert route.call_count == 2
+    assert client.rate_limit["remaining"] == 0
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_query_waits_when_budget_is_exhausted(monkeypatch):
+    client = GitHubGraphQLClient(token="test_token")
+    client.rate_limit = {"remaining": 0, "reset": int(time.time()) + 30}
+    waits = []
+
+    async def record_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(graphql_module, "_sleep", record_sleep)
+    respx.post(GRAPHQL_URL).mock(return_value=Response(200, json=threads_payload("T1")))
+
+    await client.get_review_threads("acme", "demo", 1)
+
+    assert len(waits) == 1 and 0 < waits[0] <= 30
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_far_budget_reset_fails_fast(monkeypatch):
+    client = GitHubGraphQLClient(token="test_token")
+    waits = []
+
+    async def record_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(graphql_module, "_sleep", record_sleep)
+    reset = str(int(time.time()) + 3600)
+    route = respx.post(GRAPHQL_URL).mock(
+        return_value=Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+    )
+
+    with pytest.raises(ValueError, match="rate limit exceeded"):
+        await client.get_review_threads("acme", "demo", 1)
+    assert route.call_count == 1
+
+    with pytest.raises(ValueError, match="rate limit exceeded"):
+        await client.get_review_threads("acme", "demo", 2)
+    assert route.call_count == 1
+    assert waits == []
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_exhausted_budget_is_waited_out_once(monkeypatch):
+    client = GitHubGraphQLClient(token="test_token")
+    waits = []
+
+    async def record_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(graphql_module, "_sleep", record_sleep)
+    reset = str(int(time.time()) + 30)
+    limited = Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+    respx.post(GRAPHQL_URL).mock(side_effect=[limited, Response(200, json=threads_payload("T1"))])
+
+    await client.get_review_threads("acme", "demo", 1)
+
+    assert len(waits) == 1 and 0 < waits[0] <= 30
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_concurrent_queries_are_bounded():
+    client = GitHubGraphQLClient(token="test_token", max_concurrency=1)
+    in_flight = peak = 0
+
+    async def track(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await anyio.lowlevel.checkpoint()
+        in_flight -= 1
+        return Response(200, json=threads_payload("T1"))
+
+    respx.post(GRAPHQL_URL).mock(side_effect=track)
+    async with anyio.create_task_group() as tg:
+        for number in (1, 2, 3):
+            tg.start_soon(client.get_review_threads, "acme", "demo", number)
+
+    assert peak == 1
+    await client.aclose()
+
+
+def test_logger_follows_configuration_applied_after_import(capsys):
+    configure_logging("INFO")
+    # Keep the module logger lazy so later tests see their own configuration
+    structlog.configure(cache_logger_on_first_use=False)
+    try:
+        graphql_module.logger.debug("github_graphql_debug")
+        graphql_module.logger.warning("github_graphql_retry", status=502)
+    finally:
+        structlog.reset_defaults()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert '"event":"github_graphql_retry"' in captured.err
+    assert '"component":"graphql_client"' in captured.err
+    assert "github_graphql_debug" not in captured.err
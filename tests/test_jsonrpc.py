@@ -0,0 +1,189 @@
+import io
+import json
+import os
+import sys
+
+import anyio
+import pytest
+
+from mcp_server.jsonrpc import JSONRPCServer
+
+
+async def echo(params):
+    return {"echo": params}
+
+
+def make_server() -> JSONRPCServer:
+    return JSONRPCServer(
+        {"echo": echo},
+        schemas={"echo": {"type": "object", "properties": {"value": {"type": "string"}}}},
+    )
+
+
+async def serve(monkeypatch, *lines: str, server: JSONRPCServer | None = None) -> list[dict]:
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    monkeypatch.setattr(sys, "stdout", stdout)
+    await (server or make_server()).serve_stdio()
+    stdout.flush()
+    return [json.loads(raw) for raw in stdout.buffer.getvalue().splitlines()]
+
+
+@pytest.mark.anyio
+async def test_tools_list_includes_schemas():
+    response = await make_server().handle({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+    (tool,) = response["result"]["tools"]
+    assert tool["name"] == "echo"
+    assert tool["inputSchema"]["properties"] == {"value": {"type": "string"}}
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_round_trip(monkeypatch):
+    responses = await serve(
+        monkeypatch,
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "echo", "params": {"value": "hi"}}),
+        "not json",
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "missing"}),
+    )
+
+    by_id = {r["id"]: r for r in responses}
+    assert by_id[1] == {"jsonrpc": "2.0", "id": 1, "result": {"echo": {"value": "hi"}}}
+    assert by_id[None]["error"]["code"] == -32700
+    assert by_id[2]["error"]["code"] == -32603
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_does_not_block_on_slow_handler(monkeypatch):
+    released = anyio.Event()
+
+    async def slow(params):
+        await released.wait()
+        return {"slow": True}
+
+    async def fast(params):
+        released.set()
+        return {"fast": True}
+
+    server = JSONRPCServer({"slow": slow, "fast": fast})
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    lines = [
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "slow"}),
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "fast"}),
+    ]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    with anyio.fail_after(5):
+        await server.serve_stdio()
+
+    stdout.flush()
+    responses = [json.loads(raw) for raw in stdout.buffer.getvalue().splitlines()]
+    assert [r["id"] for r in responses] == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_reads_from_pipe(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"jsonrpc": "2.0", "id": 1, "method": "echo", "params": {}}\n')
+    os.write(write_fd, b'{"jsonrpc": "2.0", "id": 2, "method": "echo", "params": {"value": "x"}}')
+    os.close(write_fd)
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    with open(read_fd, encoding="utf-8") as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        await make_server().serve_stdio()
+        assert os.get_blocking(read_fd)
+
+    responses = [json.loads(raw) for raw in stdout.buffer.getvalue().splitlines()]
+    by_id = {r["id"]: r["result"] for r in responses}
+    assert by_id == {1: {"echo": {}}, 2: {"echo": {"value": "x"}}}
+
+
+@pytest.mark.anyio
+async def test_tools_call_wraps_result_as_text():
+    server = make_server()
+
+    response = await server.handle(
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "echo"}}
+    )
+    assert response == {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "result": {"content": [{"type": "text", "text": '{"echo":{}}'}]},
+    }
+
+    with pytest.raises(ValueError, match="Unknown tool: nope"):
+        await server.handle(
+            {"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {"name": "nope"}}
+        )
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_handles_batches(monkeypatch):
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "echo", "params": {"n": 1}},
+        {"jsonrpc": "2.0", "method": "echo"},  # notification: no reply
+        {"jsonrpc": "2.0", "id": 2, "method": "missing"},
+    ]
+    responses = await serve(
+        monkeypatch, json.dumps(batch), json.dumps([batch[1]]), json.dumps([])
+    )
+
+    (batch_reply,) = [r for r in responses if isinstance(r, list)]
+    (empty_reply,) = [r for r in responses if isinstance(r, dict)]
+    assert [r["id"] for r in batch_reply] == [1, 2]
+    assert batch_reply[0]["result"] == {"echo": {"n": 1}}
+    assert batch_reply[1]["error"]["code"] == -32603
+    assert empty_reply["error"]["code"] == -32600
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_never_replies_to_notifications(monkeypatch):
+    seen = []
+
+    async def record(params):
+        seen.append(params)
+        return {}
+
+    server = JSONRPCServer({"record": record})
+    responses = await serve(
+        monkeypatch,
+        json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}),
+        json.dumps({"jsonrpc": "2.0", "method": "record", "params": {"n": 1}}),
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "record", "params": {"n": 2}}),
+        server=server,
+    )
+
+    assert [r["id"] for r in responses] == [1]
+    assert sorted(p["n"] for p in seen) == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_serve_stdio_survives_unserializable_results(monkeypatch):
+    async def int_keys(params):
+        return {1: "x"}
+
+    async def too_big(params):
+        return {"n": 2**70}
+
+    server = JSONRPCServer({"int_keys": int_keys, "too_big": too_big})
+    responses = await serve(
+        monkeypatch,
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "int_keys"}),
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "too_big"}),
+        json.dumps([{"jsonrpc": "2.0", "id": 3, "method": "too_big"}]),
+        json.dumps({"jsonrpc": "2.0", "id": 4, "method": "int_keys"}),
+        json.dumps(
+            {"jsonrpc": "2.0", "id": 5, "method": "tools/call", "params": {"name": "int_keys"}}
+        ),
+        server=server,
+    )
+
+    by_id = {r["id"]: r for r in responses if isinstance(r, dict)}
+    (batch_reply,) = [r for r in responses if isinstance(r, list)]
+    assert by_id[1]["result"] == {"1": "x"}
+    assert by_id[2]["error"]["code"] == -32603
+    assert batch_reply[0]["error"]["code"] == -32603
+    assert by_id[4]["result"] == {"1": "x"}
+    assert json.loads(by_id[5]["result"]["content"][0]["text"]) == {"1": "x"}
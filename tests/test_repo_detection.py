@@ -65,3 +65,64 @@ def test_get_repo_reads_git_config(monkeypatch, tmp_path, remote_url, expected):
     server = MCPServer(token="token", client=MagicMock(), graphql=MagicMock())
 
     assert server._get_repo() == expected
+
+
+def test_get_repo_tolerates_repeated_git_config_keys(monkeypatch, tmp_path):
+    src_dir = tmp_path / "project" / "src" / "mcp_server"
+    src_dir.mkdir(parents=True)
+    git_dir = tmp_path / "project" / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        '[remote "origin"]\n'
+        "\turl = https://github.com/owner/repo%2Dname.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        "\tfetch = +refs/pull/*/head:refs/remotes/origin/pr/*\n"
+    )
+
+    monkeypatch.setattr(server_module, "__file__", str(src_dir / "server.py"))
+    monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+
+    def fail_subprocess(*args, **kwargs):
+        raise AssertionError("git config should be parsed without forking git")
+
+    monkeypatch.setattr(server_module.subprocess, "run", fail_subprocess)
+
+    server = MCPServer(token="token", client=MagicMock(), graphql=MagicMock())
+
+    assert server._get_repo() == ("owner", "repo%2Dname")
+
+
+def test_get_repo_skips_git_when_config_has_no_github_origin(monkeypatch, tmp_path):
+    src_dir = tmp_path / "project" / "src" / "mcp_server"
+    src_dir.mkdir(parents=True)
+    git_dir = tmp_path / "project" / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text('[remote "origin"]\n\turl = https://example.com/owner/repo.git\n')
+
+    monkeypatch.setattr(server_module, "__file__", str(src_dir / "server.py"))
+    monkeypatch.setenv("GITHUB_REPOSITORY", "env-owner/env-repo")
+
+    def fail_subprocess(*args, **kwargs):
+        raise AssertionError("git should only be forked when .git/config is missing")
+
+    monkeypatch.setattr(server_module.subprocess, "run", fail_subprocess)
+
+    server = MCPServer(token="token", client=MagicMock(), graphql=MagicMock())
+
+    assert server._get_repo() == ("env-owner", "env-repo")
+
+
+def test_get_repo_asks_git_for_worktree_checkouts(monkeypatch, tmp_path):
+    src_dir = tmp_path / "project" / "src" / "mcp_server"
+    src_dir.mkdir(parents=True)
+    (tmp_path / "project" / ".git").write_text("gitdir: /elsewhere/.git/worktrees/project\n")
+
+    monkeypatch.setattr(server_module, "__file__", str(src_dir / "server.py"))
+    monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+    run = MagicMock(return_value=MagicMock(returncode=0, stdout="git@github.com:owner/repo.git\n"))
+    monkeypatch.setattr(server_module.subprocess, "run", run)
+
+    server = MCPServer(token="token", client=MagicMock(), graphql=MagicMock())
+
+    assert server._get_repo() == ("owner", "repo")
+    run.assert_called_once()
@@ -1,15 +1,105 @@
 import pytest
+import respx
+from httpx import Response
 
-from mcp_server.actions import GitHubClient
+from mcp_server.actions import AsyncGitHubClient
 from mcp_server.graphql_client import GitHubGraphQLClient
 from mcp_server.server import MCPServer
 
 
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(MCPServer, "_get_repo", lambda self: ("acme", "demo"))
+    client = AsyncGitHubClient(token="test_token")
+    graphql = GitHubGraphQLClient(token="test_token")
+    return MCPServer(token="test_token", client=client, graphql=graphql)
+
+
 @pytest.mark.anyio
 async def test_health_tool():
-    client = GitHubClient(token="test_token")
+    client = AsyncGitHubClient(token="test_token")
     graphql = GitHubGraphQLClient(token="test_token")
     server = MCPServer(token="test_token", client=client, graphql=graphql)
     result = await server.health({})
     assert result["status"] == "ok"
     assert "rate_limit" in result
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_review_pr_annotates_threads(server):
+    respx.get("https://api.github.com/user").mock(return_value=Response(200, json={"login": "me"}))
+    respx.get("https://api.github.com/repos/acme/demo/pulls/7").mock(
+        return_value=Response(200, json={"number": 7})
+    )
+    respx.get("https://api.github.com/repos/acme/demo/pulls/7/reviews").mock(
+        return_value=Response(200, json=[{"id": 1, "state": "COMMENTED"}])
+    )
+    thread = {
+        "id": "T1",
+        "isResolved": False,
+        "comments": {
+            "nodes": [
+                {"id": "C1", "author": {"login": "dependabot[bot]"}},
+                {"id": "C2", "author": {"login": "me"}},
+            ]
+        },
+    }
+    respx.post("https://api.github.com/graphql").mock(
+        return_value=Response(
+            200,
+            json={"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": [thread]}}}}},
+        )
+    )
+
+    result = await server.review_pr({"pr_number": 7})
+
+    assert result["pr_info"] == {"number": 7}
+    assert result["authenticated_user"] == "me"
+    assert result["threads_count"] == 1
+    bot, me = (c["author"] for c in result["threads"][0]["comments"]["nodes"])
+    assert bot["is_bot"] is True and bot["is_me"] is False
+    assert me["is_bot"] is False and me["is_me"] is True
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_review_issue_annotates_comments(server):
+    respx.get("https://api.github.com/user").mock(return_value=Response(200, json={"login": "me"}))
+    respx.get("https://api.github.com/repos/acme/demo/issues/3").mock(
+        return_value=Response(200, json={"number": 3, "pull_request": None})
+    )
+    respx.get("https://api.github.com/repos/acme/demo/issues/3/comments").mock(
+        return_value=Response(200, json=[{"id": 1, "user": {"login": "renovate[bot]"}}])
+    )
+
+    result = await server.review_issue({"issue_number": 3})
+
+    assert result["issue"]["number"] == 3
+    assert result["authenticated_user"] == "me"
+    assert result["comments"][0]["user"] == {"login": "renovate[bot]", "is_bot": True, "is_me": False}
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_authenticated_user_is_fetched_once(server):
+    user = respx.get("https://api.github.com/user").mock(return_value=Response(200, json={"login": "me"}))
+
+    assert await server._get_authenticated_user() == "me"
+    assert await server._get_authenticated_user() == "me"
+    assert user.call_count == 1
+
+
+def test_repo_is_detected_once(monkeypatch):
+    server = MCPServer(token="test_token", client=AsyncGitHubClient(token="test_token"), graphql=None)
+    calls = []
+    monkeypatch.setattr(MCPServer, "_detect_repo", lambda self: calls.append(1) or ("acme", "demo"))
+
+    assert server._get_repo() == server._get_repo() == ("acme", "demo")
+    assert len(calls) == 1
+
+
+def test_tool_tables_are_built_once(server):
+    assert server.schemas() is server.schemas()
+    assert server.handlers() is server.handlers()
+    assert set(server.schemas()) == set(server.handlers())